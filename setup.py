@@ -36,6 +36,7 @@ setup(
     # Packages
     packages=['sudoku_manager'],
     install_requires=[],
+    python_requires='>=3.7',
     # Other info
     keywords=['sudoku', 'generator', 'solver', 'easy', "generate", "solve"],
     classifiers=[
@@ -1,4 +1,4 @@
 name = "sudoku_manager"
 from sudoku_manager.sudoku import Sudoku
-from sudoku_manager.area import Area
+from sudoku_manager.area import Area, Shape
 from sudoku_manager.cell import Cell
@@ -2,8 +2,14 @@
 """
 Description:
     Contains the Area class
+Constants:
+    CELL_AREAS: For each cell of the flattened 81-cell grid, the tuple of its (row, column, square) indexes
+    ROWS: For each row, the tuple of the indexes of its 9 cells in the flattened 81-cell grid
+    COLUMNS: For each column, the tuple of the indexes of its 9 cells in the flattened 81-cell grid
+    SQUARES: For each square, the tuple of the indexes of its 9 cells in the flattened 81-cell grid
 Classes:
     Area: Represents a zone of a Sudoku. Contains 9 cells, each with a different data/number.
+    Shape: Enumeration of the types of Area (row, column, square)
 """
 
 
@@ -11,16 +17,38 @@ Classes:
 # > Imports
 # --------------------------------------------------------------------------------
 # Built-in
+from enum import IntEnum
 
 # Third-party
 
 # Local
-from sudoku_manager.cell import Cell
+from sudoku_manager.cell import CANDIDATE_SETS, POPCOUNT
+
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+# Static layout of the 27 areas, using the cell indexes of the flattened 81-cell grid
+ROWS = tuple(tuple(row * 9 + column for column in range(9)) for row in range(9))
+COLUMNS = tuple(tuple(row * 9 + column for row in range(9)) for column in range(9))
+SQUARES = tuple(
+    tuple((square // 3 * 3 + i // 3) * 9 + square % 3 * 3 + i % 3 for i in range(9))
+    for square in range(9)
+)
+CELL_AREAS = tuple((i // 9, i % 9, (i // 27) * 3 + (i % 9) // 3) for i in range(81))
 
 
 # --------------------------------------------------------------------------------
 # > Classes
 # --------------------------------------------------------------------------------
+class Shape(IntEnum):
+    """Enumeration of the types of Area. Its values can be used as indexes in lookup tables"""
+
+    ROW = 0
+    COLUMN = 1
+    SQUARE = 2
+
+
 class Area:
     """
     Description:
@@ -29,28 +57,38 @@ class Area:
         A Sudoku instance will have 27 Area instances : 9 rows, 9 columns, 9 squares
 
     Constants:
-        SHAPES (set): Sets of string, representing the type of Area
+        FULL_MASK (int): Bitmask with the 9 bits set, representing the numbers 1 to 9
+        SHAPES (frozenset): Set of Shape members, representing the type of Area
 
     Magic Methods:
-        __init__: Initializes the Area instance
+        __init__: Initializes the Area instance and its bitmask
         __iter__: Iterates over the list of cells (self.cells)
         __len__: Returns the quantity of cell with valid data
         __repr__: Returns a string representation of our Area instance, without its cells
 
     Attributes:
         cells (list): List of Cell instances in the Area
-        shape (string): String that indicates the type of Area. Is a value of self.SHAPES.
+        shape (Shape): Shape member that indicates the type of Area. Is a value of self.SHAPES.
         num (int): The index of the Area within the Sudoku, within the list of same shapes
+        counts (list): Number of cells holding each number, indexed by the number (index 0 is unused)
+        taken_mask (int): 9-bit mask of the numbers already written. Bit N-1 is set if N is taken
+
+    Public Methods:
+        add: Counts a new cell holding the number, and marks it as taken in the bitmask
+        remove: Uncounts a cell holding the number, and marks it as available once no cell holds it
 
     Properties:
-        available_numbers (set): Dynamically lists the numbers not yet written in its cells
-        taken_numbers (set): Dynamically finds all the numbers already written its cells
+        available_mask (int): 9-bit mask of the numbers not yet written in its cells
+        available_numbers (frozenset): Lists the numbers not yet written in its cells
+        taken_numbers (frozenset): Lists all the numbers already written in its cells
     """
 
     ###############
     #  Constants  #
     ###############
-    SHAPES = {"row", "column", "square"}
+    __slots__ = ("cells", "shape", "num", "counts", "taken_mask")
+    SHAPES = frozenset(Shape)
+    FULL_MASK = 0x1FF
 
     ###################
     #  Magic Methods  #
@@ -60,46 +98,72 @@ class Area:
         Description:
             Initializes the Area instance
             Using "shape" and "num", we can easily guess which part of the Sudoku the Area instance represents
+            The "counts" and "taken_mask" are built from the initial data of the cells,
+            and are then kept up to date by the cells
+            Counting the holders of each number keeps the bitmask right even if two cells hold the same number
         Args:
             cell_list (list): List of Cell instances stored in the area
-            shape (str): Either "row", "column", or "square"
+            shape (Shape|str): Either a Shape member, or its name ("row", "column", or "square")
             num (int): Index or position of the area
         Raises:
             KeyError: "shape" must be either "row", "column", or "square". See "self.SHAPES"
         """
-        if shape not in self.SHAPES:
-            raise KeyError(
-                "'{}' is not a valid shape for an Area instance".format(shape)
-            )
+        if isinstance(shape, str):
+            try:
+                shape = Shape[shape.upper()]
+            except KeyError:
+                raise KeyError(f"'{shape}' is not a valid shape for an Area instance") from None
+        elif not isinstance(shape, Shape):
+            raise KeyError(f"'{shape}' is not a valid shape for an Area instance")
         self.cells = cell_list
         self.shape = shape
         self.num = num
+        self.counts = [0] * 10
+        self.taken_mask = 0
+        for cell in self:
+            if cell.data is not None:
+                self.add(cell.data)
 
     def __iter__(self):
         """Iterates over the instance's cells"""
         return iter(self.cells)
 
     def __len__(self):
-        """Returns the quantity of cell with valid data"""
-        return len(self.taken_numbers)
+        """Returns the quantity of cell with valid data, by counting the bits of the bitmask"""
+        return POPCOUNT[self.taken_mask]
 
     def __repr__(self):
         """Returns a string representation of our Area instance, without its cells"""
-        return "Area(shape='{}', num={})".format(self.shape, self.num)
+        return f"Area(shape='{self.shape.name.lower()}', num={self.num})"
+
+    ####################
+    #  Public Methods  #
+    ####################
+    def add(self, number):
+        """Counts a new cell holding the number, and marks it as taken in the bitmask"""
+        self.counts[number] += 1
+        self.taken_mask |= 1 << (number - 1)
+
+    def remove(self, number):
+        """Uncounts a cell holding the number, and marks it as available once no cell holds it"""
+        self.counts[number] -= 1
+        if self.counts[number] == 0:
+            self.taken_mask &= ~(1 << (number - 1))
 
     ################
     #  Properties  #
     ################
+    @property
+    def available_mask(self):
+        """Property that returns the bitmask of the numbers that can be written in the Area"""
+        return self.FULL_MASK & ~self.taken_mask
+
     @property
     def available_numbers(self):
-        """Property that returns a set of the numbers that can be written in the Area"""
-        return Cell.NUMBERS - self.taken_numbers
+        """Property that returns a shared frozenset of the numbers that can be written in the Area"""
+        return CANDIDATE_SETS[self.available_mask]
 
     @property
     def taken_numbers(self):
-        """Property that returns a set of all the numbers already written in the Area"""
-        numbers = set()
-        for cell in self:
-            if cell.data is not None:
-                numbers.add(cell.data)
-        return numbers
+        """Property that returns a shared frozenset of all the numbers already written in the Area"""
+        return CANDIDATE_SETS[self.taken_mask]
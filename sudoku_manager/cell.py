@@ -2,6 +2,10 @@
 """
 Description:
     Contains the Cell class
+Constants:
+    CANDIDATES: For each 9-bit mask, the tuple of the numbers whose bit is set
+    CANDIDATE_SETS: Same as CANDIDATES, but as shared frozensets
+    POPCOUNT: For each 9-bit mask, the number of bits set
 Classes:
     Cell: Cell of a Sudoku instance that contains a number between 1 and 9
 """
@@ -17,6 +21,15 @@ Classes:
 # Local
 
 
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+# Lookup tables indexed by a 9-bit mask, where bit N-1 represents the number N
+CANDIDATES = tuple(tuple(i + 1 for i in range(9) if mask >> i & 1) for mask in range(512))
+CANDIDATE_SETS = tuple(frozenset(numbers) for numbers in CANDIDATES)
+POPCOUNT = tuple(len(numbers) for numbers in CANDIDATES)
+
+
 # --------------------------------------------------------------------------------
 # > Classes
 # --------------------------------------------------------------------------------
@@ -27,26 +40,32 @@ class Cell:
         A Sudoku instance should be made of 81 Cell instances
 
     Constants:
-        NUMBERS (set): Set of valid data for a Cell (numbers from 1 to 9)
-        NUMBERS_NONE (set): Same as NUMBERS, but inclues "None" in the dataset
+        NUMBERS (frozenset): Set of valid data for a Cell (numbers from 1 to 9)
+        NUMBERS_NONE (frozenset): Same as NUMBERS, but inclues "None" in the dataset
 
     Magic Methods:
         __init__: Initiliazes a Cell instance and stores its coordinates
         __repr__: Returns a string representation of our Cell instance
 
     Attributes:
-        areas (list): List of the 3 Area instances our cell is in
+        areas (tuple): Tuple of the 3 Area instances our cell is in (row, column, square)
         column (int): Index of the sudoku column where our cell is
-        data (int): Value contained in the cell. Either "None" or a number between 1 and 9
         row (int): Index of the sudoku row where our cell is
         square (int): Index of the sudoku square/box where our cell is
+
+    Properties:
+        data (int): Value contained in the cell. Either "None" or a number between 1 and 9
+            Writing it keeps the bitmasks of the cell's areas up to date
+            Writing 0 empties the cell, like in the constructor
+            For speed, writes are not validated any further: only "None", 0 or an int between 1 and 9 is accepted
     """
 
     ###############
     #  Constants  #
     ###############
-    NUMBERS = {1, 2, 3, 4, 5, 6, 7, 8, 9}
-    NUMBERS_NONE = {1, 2, 3, 4, 5, 6, 7, 8, 9, None}
+    __slots__ = ("_data", "areas", "row", "column", "square")
+    NUMBERS = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9})
+    NUMBERS_NONE = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9, None})
 
     ###################
     #  Magic Methods  #
@@ -63,23 +82,59 @@ class Cell:
             square (int): Index of the sudoku square/box where our cell is
             data (int, optional): Number contained in the cell. Defaults to None.
         """
-        try:
-            data = int(data)
-        except (ValueError, TypeError):
-            pass
-        if data not in self.NUMBERS:
-            data = None
-        self.data = data
-        self.areas = []
+        # Fast path for the common case, where "data" is already None or a valid int
+        if data is not None and not (type(data) is int and 1 <= data <= 9):
+            try:
+                data = int(data)
+            except (ValueError, TypeError):
+                data = None
+            if data not in self.NUMBERS:
+                data = None
+        self._data = data
+        self.areas = ()
         self.row = row
         self.column = column
         self.square = square
 
     def __repr__(self):
         """Returns a string representation of our Cell instance"""
-        return "Cell(data={data}, row={row}, column={column}, square={square})".format(
-            **vars(self)
-        )
+        return f"Cell(data={self._data}, row={self.row}, column={self.column}, square={self.square})"
+
+    ################
+    #  Properties  #
+    ################
+    @property
+    def data(self):
+        """Property that returns the value contained in the cell"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        """
+        Description:
+            Writes the value in the cell and updates the counts and bitmasks of its areas
+            Writing 0 empties the cell, like in the constructor
+            For speed, the value is not validated any further: it must be "None", 0 or an int between 1 and 9
+        Args:
+            value (int): Either None, 0 or a number between 1 and 9
+        """
+        # Called at every move of the solver, so we work on the areas directly instead of calling Area methods
+        if not value:
+            value = None
+        old_value = self._data
+        if old_value is not None:
+            old_bit = 1 << (old_value - 1)
+            for area in self.areas:
+                counts = area.counts
+                counts[old_value] -= 1
+                if not counts[old_value]:
+                    area.taken_mask &= ~old_bit
+        if value is not None:
+            bit = 1 << (value - 1)
+            for area in self.areas:
+                area.counts[value] += 1
+                area.taken_mask |= bit
+        self._data = value
 
     # ! Adds data integrity but slows down the solving process for the Sudoku instance
     # def __setattr__(self, name, value):
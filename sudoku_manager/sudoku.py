@@ -2,6 +2,9 @@
 """
 Description:
     Contains the Sudoku class
+Constants:
+    ACTION_UNDO: Name of the "undo" action in the history logs
+    ACTION_WRITE: Name of the "write" action in the history logs
 Classes:
     Sudoku: Sudoku generator and solver
 """
@@ -13,14 +16,23 @@ Classes:
 # Built-in
 import json
 import os
-from random import choice, seed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from random import choice, sample, shuffle
 from time import perf_counter
 
 # Third-party
 
 # Local
-from sudoku_manager.area import Area
-from sudoku_manager.cell import Cell
+from sudoku_manager.area import CELL_AREAS, COLUMNS, ROWS, SQUARES, Area, Shape
+from sudoku_manager.cell import CANDIDATES, POPCOUNT, Cell
+
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+# Module-level, as they are read at every move of the solver
+ACTION_WRITE = "write"
+ACTION_UNDO = "undo"
 
 
 # --------------------------------------------------------------------------------
@@ -39,8 +51,11 @@ class Sudoku:
 
     Constants:
         ACTIONS (list): List of actions names that we will use in "history" and "complete_history"
+        ATTEMPTS_PER_GRID (int): Number of sets of empty cells tried on a full grid by "try_generate_grid"
+            A full grid is cheaper to solve than an attempt, so reusing it more does not speed things up
         COL_SEP (str): Column separator used when printing the sudoku grid
-        DIFFICULTIES (dict): Dict of difficulties, each containing a dict with: name, min_time, max_time, empty_cells
+        DIFFICULTIES (dict): Dict of difficulties, each containing a dict with: name, min_moves, max_moves, empty_cells
+            The moves are the "total_moves" needed to solve the puzzle, which unlike time do not depend on the machine
         ROW_SEP (str): Row separator used when printing the sudoku grid
 
     Magic Methods:
@@ -53,9 +68,14 @@ class Sudoku:
         display_row: Returns a string shaped like a Sudoku row for said row
         generate_areas: Creates the 27 Area instances (9 rows, 9 columns, 9 squares)
         generate_cells: Generates and stores the 81 Cell instances based on the initial grid
+        get_available_cell_mask: Gets the bitmask of the values that can be written in the cell
         get_available_cell_values: Gets the values that can be written in the cell, based on the sudoku rules
+        has_duplicates: Checks if a number is written more than once in the same area, using the areas' counts
+        is_complete: Checks if the grid is fully and validly filled, using the areas' bitmasks
+        propagate_singles: Writes every forced value, until no empty cell has a single available value
         shape_is_valid: Checks if the initial grid is a list of 9-element lists
         solve: Starts a timer and tries to solve the sudoku
+        to_bytes: Returns the current grid as 81 bytes, where 0 represents an empty cell
         undo: Takes care of the backtracking by undoing previous actions
         write_and_log: Writes down a number in a Cell, and log the action in the history logs
 
@@ -63,11 +83,12 @@ class Sudoku:
         areas (list): List containing the 27 Area instances, in order
         cells (list): List containing the 81 Cell instances, in order
         columns (list): List containing the 9 Area instances representing the columns, in order
-        complete_history (list): Complete history of every action made during the solving process
-        empty_cells (list): List of empty cells in the Sudoku. Updated at every move
+        complete_history (list): Complete history of every action made during the solving process (if recorded)
+        empty_cells (list): List of empty cells in the Sudoku, in no particular order. Updated at every move
         grid (list): The initial 9x9 list that created the instance
         history (list): Same as "complete_history", but "undo" is not logged and removes the last entry
         moves (int): The number of moves made (but "undo" removes a move)
+        record_complete_history (bool): Whether actions are logged in "complete_history". Diagnostic only
         required_moves: The number of empty cells in the initial grid. Used for "self.solved"
         rows (list): List containing the 9 Area instances representing the rows, in order
         solved_grid (list): The solved Sudoku in a 9x9 format
@@ -81,8 +102,10 @@ class Sudoku:
 
     Class Methods:
         create_from_81: Creates a Sudoku instance using a 81-element list instead of a 9x9 list
+        create_from_bytes: Creates a Sudoku instance from 81 bytes, where 0 represents an empty cell
         create_from_json: Creates a Sudoku from a grid stored in a JSON file
         generate_grid: Loops until a valid sudoku is generated, based on the difficulty settings
+        try_generate_grid: Tries to generate a valid sudoku from a new full grid, based on the difficulty settings
 
     Static Methods:
         output_as_json: Jsonify the data and writes in the file at the given path
@@ -91,13 +114,14 @@ class Sudoku:
     ###############
     #  Constants  #
     ###############
-    ACTIONS = ["write", "undo"]
+    ACTIONS = [ACTION_WRITE, ACTION_UNDO]
+    ATTEMPTS_PER_GRID = 10
     DIFFICULTIES = {
-        1: {"name": "easy", "min_time": 0.000, "max_time": 0.005, "empty_cells": 45},
-        2: {"name": "medium", "min_time": 0.005, "max_time": 0.010, "empty_cells": 52},
-        3: {"name": "hard", "min_time": 0.010, "max_time": 0.020, "empty_cells": 59},
-        4: {"name": "harder", "min_time": 0.020, "max_time": 0.040, "empty_cells": 66},
-        5: {"name": "hardest", "min_time": 0.040, "max_time": 0.060, "empty_cells": 70},
+        1: {"name": "easy", "min_moves": 0, "max_moves": 60, "empty_cells": 45},
+        2: {"name": "medium", "min_moves": 60, "max_moves": 250, "empty_cells": 52},
+        3: {"name": "hard", "min_moves": 250, "max_moves": 1000, "empty_cells": 59},
+        4: {"name": "harder", "min_moves": 1000, "max_moves": 5000, "empty_cells": 66},
+        5: {"name": "hardest", "min_moves": 5000, "max_moves": 50000, "empty_cells": 70},
     }
     COL_SEP = "|"
     ROW_SEP = "------|-------|------"
@@ -105,12 +129,14 @@ class Sudoku:
     ###################
     #  Magic Methods  #
     ###################
-    def __init__(self, grid):
+    def __init__(self, grid, record_complete_history=False):
         """
         Description:
             Checks if "grid" has a valid shape and initializes our Sudoku instance
         Args:
             grid (list): List of lists, where each sublist has 9 elements. Basically a 9x9 grid
+            record_complete_history (bool, optional): If True, logs every action in "complete_history".
+                The solver never reads it, so it is disabled by default to save time and memory. Defaults to False.
         Raises:
             IndexError: Returned if the "grid" arg is not a 9x9 list
         """
@@ -128,6 +154,7 @@ class Sudoku:
         self.total_moves = 0
         self.history = []
         self.complete_history = []
+        self.record_complete_history = record_complete_history
 
     def __iter__(self):
         """Iterates over the cells of the Sudoku instance"""
@@ -142,15 +169,13 @@ class Sudoku:
     ####################
     def display(self):
         """Returns a string shaped like our Sudoku"""
-        sudoku_string = ""
+        lines = []
         for i in range(9):
             # Every third row, we add a separator
             if i % 3 == 0 and i > 0:
-                sudoku_string += self.ROW_SEP
-                sudoku_string += "\n"
-            sudoku_string += self.display_row(i)
-            sudoku_string += "\n"
-        return sudoku_string
+                lines.append(self.ROW_SEP)
+            lines.append(self.display_row(i))
+        return "\n".join(lines) + "\n"
 
     def display_row(self, row_index):
         """
@@ -161,20 +186,14 @@ class Sudoku:
         Returns:
             str: String representation of our row
         """
-        row_string = ""
+        parts = []
         for i, cell in enumerate(self.rows[row_index]):
             # Every third cell, we had a seperator
             if i % 3 == 0 and i > 0:
-                row_string += self.COL_SEP
-                row_string += " "
+                parts.append(self.COL_SEP)
             # Empty cells are represented as "." on the grid
-            if cell.data is None:
-                row_string += "."
-            else:
-                row_string += str(cell.data)
-            row_string += " "
-        row_string.strip()
-        return row_string
+            parts.append("." if cell.data is None else str(cell.data))
+        return " ".join(parts) + " "
 
     def generate_areas(self):
         """
@@ -184,48 +203,113 @@ class Sudoku:
             Meaning each Cell instance will be in 3 Areas: 1 row, 1 column, 1 square
             All the areas are then stored as attributes
         """
-        # Grouping the cells
-        cells_by_rows = [[cell for cell in self if cell.row == i] for i in range(9)]
-        cells_by_columns = [[cell for cell in self if cell.column == i] for i in range(9)]
-        cells_by_squares = [[cell for cell in self if cell.square == i] for i in range(9)]
-        # Creating the different areas and storing them
-        self.rows = [Area(cell_list, "row", i) for i, cell_list in enumerate(cells_by_rows)]
-        self.columns = [Area(cell_list, "column", i) for i, cell_list in enumerate(cells_by_columns)]
-        self.squares = [Area(cell_list, "square", i) for i, cell_list in enumerate(cells_by_squares)]
-        self.areas = self.rows + self.columns + self.squares
-        # Linking the Cell instances to their 3 Area instances
-        for cell in self:
-            cell.areas = [
-                self.rows[cell.row],
-                self.columns[cell.column],
-                self.squares[cell.square],
-            ]
+        # Creating the different areas from the precomputed cell indexes, and storing them
+        cells = self.cells
+        rows = [Area([cells[j] for j in indexes], Shape.ROW, i) for i, indexes in enumerate(ROWS)]
+        columns = [Area([cells[j] for j in indexes], Shape.COLUMN, i) for i, indexes in enumerate(COLUMNS)]
+        squares = [Area([cells[j] for j in indexes], Shape.SQUARE, i) for i, indexes in enumerate(SQUARES)]
+        self.rows, self.columns, self.squares = rows, columns, squares
+        self.areas = rows + columns + squares
+        # Linking the Cell instances to their 3 Area instances, in a single pass
+        for cell in cells:
+            cell.areas = (rows[cell.row], columns[cell.column], squares[cell.square])
 
     def generate_cells(self):
         """Generates and stores the 81 Cell instances based on the initial grid"""
-        self.cells = []
-        for x, row in enumerate(self.grid):
-            for y, col in enumerate(row):
-                area = (x // 3) * 3 + (y // 3)
-                value = self.grid[x][y]
-                cell = Cell(x, y, area, value)
-                self.cells.append(cell)
+        grid = self.grid
+        self.cells = [Cell(row, column, square, grid[row][column]) for row, column, square in CELL_AREAS]
+
+    def get_available_cell_mask(self, cell):
+        """
+        Description:
+            Gets the bitmask of the values that can be written in the cell, based on the sudoku rules
+            A value can be written only if it does not already exist in the cell's row, column, and square
+            So for a given cell, we merge the bitmasks of its 3 Area instances
+        Args:
+            cell (Cell): A Cell instance from the Sudoku
+        Returns:
+            int: 9-bit mask where bit N-1 is set if N can be written in the Cell
+        """
+        row, column, square = cell.areas
+        return Area.FULL_MASK & ~(row.taken_mask | column.taken_mask | square.taken_mask)
 
     def get_available_cell_values(self, cell):
         """
         Description:
             Gets the values that can be written in the cell, based on the sudoku rules
-            A value can be written only if it does not already exist in the cell's row, column, and square
-            So for a given cell, we check the content of its 3 Area instances
+            See "self.get_available_cell_mask()"
         Args:
             cell (Cell): A Cell instance from the Sudoku
         Returns:
             set: Set of values that can be written in the Cell
         """
-        available_values = Cell.NUMBERS.copy()
-        for area in cell.areas:
-            available_values -= area.taken_numbers
-        return available_values
+        return set(CANDIDATES[self.get_available_cell_mask(cell)])
+
+    def has_duplicates(self):
+        """
+        Description:
+            Checks if a number is written more than once in the same area, using the areas' counts
+        Returns:
+            bool: True if at least one area holds a number twice
+        """
+        return any(count > 1 for area in self.areas for count in area.counts)
+
+    def is_complete(self):
+        """
+        Description:
+            Checks if the grid is fully and validly filled, using the areas' bitmasks
+            An area is complete when its 9 bits are set, which means each number from 1 to 9 is written once
+            As an area has 9 cells, an empty cell or a duplicate always leaves at least one bit unset
+        Returns:
+            bool: True if all 27 areas are complete
+        """
+        full_mask = Area.FULL_MASK
+        return all(area.taken_mask == full_mask for area in self.areas)
+
+    def propagate_singles(self):
+        """
+        Description:
+            Writes every forced value, until no empty cell has a single available value
+            A cell with a single available value (a "naked single") can be filled without guessing
+            Each write can create new singles, so we keep scanning the empty cells until nothing changes
+            The writes are logged without other available values, so "undo" reverts them while backtracking
+            If a cell has no available value, we stop right away and let the solver backtrack
+            The last scan writes nothing, so it also gives us the most constrained cell for free:
+            the one with the fewest available values (Minimum Remaining Values heuristic)
+            Branching on that cell first greatly reduces the number of backtracks
+        Returns:
+            int: Index of the most constrained cell in "self.empty_cells" (or of a cell without value)
+            int: 9-bit mask of the values that can be written in that cell (0 if we must backtrack)
+        """
+        # This is the hottest loop of the solver: the mask check is inlined and lookups are bound locally
+        empty_cells = self.empty_cells
+        write_and_log = self.write_and_log
+        full_mask = Area.FULL_MASK
+        popcount = POPCOUNT
+        found_single = True
+        while found_single:
+            found_single = False
+            best_index, best_mask, best_count = 0, 0, 10
+            i = 0
+            while i < len(empty_cells):
+                cell = empty_cells[i]
+                row, column, square = cell.areas
+                mask = full_mask & ~(row.taken_mask | column.taken_mask | square.taken_mask)
+                if mask == 0:
+                    return i, 0
+                # A mask with a single bit set becomes 0 once its lowest bit is removed
+                if mask & (mask - 1) == 0:
+                    # The last cell takes the freed slot, and is checked next
+                    empty_cells[i] = empty_cells[-1]
+                    empty_cells.pop()
+                    write_and_log(cell, mask.bit_length(), 0)
+                    found_single = True
+                else:
+                    count = popcount[mask]
+                    if count < best_count:
+                        best_index, best_mask, best_count = i, mask, count
+                    i += 1
+        return best_index, best_mask
 
     def shape_is_valid(self):
         """Checks if the initial grid is a list of 9-element lists"""
@@ -235,7 +319,7 @@ class Sudoku:
                     return False
         return True
 
-    def solve(self, randomly=False, time_limit=None):
+    def solve(self, randomly=False, time_limit=None, move_limit=None):
         """
         Description:
             Description:
@@ -243,48 +327,82 @@ class Sudoku:
             We go through empty cells and tries the available inputs.
             In case of failure, the backtrack to our previous action
             The logic is as follows:
-            - Get the FIRST empty cell
-            - Check what we can write in it
+            - Write all the forced values (cells with a single available value)
+            - Get the empty cell with the fewest available values
+            - Check what we can write in it, as a 9-bit mask
             - Write the first available value (or a random one if "randomly=True")
-            - Log in the "history" the cell, the value, and the other possible values
+            - Log in the "history" the cell, the value, and the mask of the other possible values
             - Remove said cell from the empty list
             - Move on to the next cell
             - If a cell has no possible value, "undo" the previous action and try a different number
             The Sudoku is solved if there are no empty cell left
             The Sudoku is unsolvable if we try to "undo" when there is no move in the archive
+            The Sudoku is also unsolvable if a number is given twice in the same area
             "randomly" often slows down the solving process, but is useful for generating new Sudokus
         Args:
             randomly (bool, optional): If True, randomly choses the value to input (instead of the first one). Defaults to False.
             time_limit (float, optional): Stops the solving process after N seconds. Defaults to None.
+            move_limit (int, optional): Stops the solving process after N moves. Unlike "time_limit",
+                it does not depend on the machine. Defaults to None.
         """
-        self.time = perf_counter()
-        seed()
-        while not self.solved:
-            if time_limit and float(time_limit) <= (perf_counter() - self.time):
-                self.status = "time_limit_exceeded"
-                break
-            # We arbitrarily get the first empty cell
-            cell = self.empty_cells[0]
-            values = self.get_available_cell_values(cell)
-            # Having no values mean we are stuck and must backtrack
-            if len(values) == 0:
-                fail = self.undo()
-                # If we can't backtrack anymore, it means we've tried every possible combinaion
-                if fail:
-                    self.status = "no_valid_solution"
+        start = perf_counter()
+        deadline = start + float(time_limit) if time_limit else None
+        # An empty "empty_cells" list means solved, and is cheaper to check than the "solved" property
+        empty_cells = self.empty_cells
+        # A number given twice in an area can never be completed, and would send the search through every grid
+        if self.has_duplicates():
+            self.status = "no_valid_solution"
+        else:
+            while empty_cells:
+                if deadline is not None and perf_counter() >= deadline:
+                    self.status = "time_limit_exceeded"
                     break
-            else:
-                self.empty_cells.pop(0)  # Update the "empty_cells" list
-                if randomly:
-                    value = choice(list(values))
-                    values.remove(value)
+                if move_limit is not None and self.total_moves >= move_limit:
+                    self.status = "move_limit_exceeded"
+                    break
+                # We first write the forced values, which may be enough to finish the sudoku
+                # Then we get the most constrained empty cell, found by the last propagation scan
+                index, mask = self.propagate_singles()
+                if not empty_cells:
+                    continue
+                cell = empty_cells[index]
+                # Having no values mean we are stuck and must backtrack
+                if mask == 0:
+                    fail = self.undo()
+                    # If we can't backtrack anymore, it means we've tried every possible combinaion
+                    if fail:
+                        self.status = "no_valid_solution"
+                        break
                 else:
-                    value = values.pop()  # Removes and returns one of the values
-                self.write_and_log(cell, value, values)
+                    # Update the "empty_cells" list: order does not matter, so we move the last cell to the freed slot
+                    empty_cells[index] = empty_cells[-1]
+                    empty_cells.pop()
+                    if randomly:
+                        value = choice(CANDIDATES[mask])
+                        mask ^= 1 << (value - 1)
+                    else:
+                        # Isolates the lowest bit, which is the smallest value, and removes it from the mask
+                        bit = mask & -mask
+                        value = bit.bit_length()
+                        mask ^= bit
+                    self.write_and_log(cell, value, mask)
+            # The loop only ends without a "break" when there is no empty cell left
+            else:
+                self.status = "solved"
         # We time the process regardless of the outcome
-        self.time = round(perf_counter() - self.time, 4)
-        self.status = "solved"
-        self.solved_grid = [[cell.data for cell in self.cells[i:i+9]] for i in range(0, 81, 9)]
+        self.time = round(perf_counter() - start, 4)
+        data = [cell.data for cell in self.cells]
+        self.solved_grid = [data[i:i+9] for i in range(0, 81, 9)]
+
+    def to_bytes(self):
+        """
+        Description:
+            Returns the current grid as 81 bytes, where 0 represents an empty cell
+            This is a compact format for storing or exchanging many grids. See "self.create_from_bytes()"
+        Returns:
+            bytes: The 81 cells of the grid, row by row
+        """
+        return bytes(cell.data or 0 for cell in self)
 
     def undo(self):
         """
@@ -292,30 +410,30 @@ class Sudoku:
             Takes care of the backtracking by undoing previous actions
             Goes in the history log, finds the last moves, and undo it
             If other values for the cell were available, tries one of them
-            Else, goes back once more (and so on)
+            Else, goes back once more (and so on), in a loop rather than through recursion
         Returns:
             bool: Returns True if it cannot backtrack anymore, meaning it is unsolvable
         """
-        self.moves -= 1
-        # Get the last action from the history log
-        try:
-            _, cell, _, available_values = self.history.pop()
-            action = self.ACTIONS[1]
-            self.complete_history.append((action, cell, cell.data, available_values))
-        # If no action available, it means we've tried everything
-        except IndexError:
-            return True
-        # If we have no more values for the cell, we put it back to "None" and go back one move
-        if len(available_values) == 0:
+        while True:
+            # Get the last action from the history log
+            try:
+                _, cell, _, available_mask = self.history.pop()
+            # If no action available, it means we've tried everything
+            except IndexError:
+                return True
+            self.moves -= 1
+            if self.record_complete_history:
+                self.complete_history.append((ACTION_UNDO, cell, cell.data, available_mask))
+            # If we have other values for the cell, we try one of them
+            if available_mask != 0:
+                bit = available_mask & -available_mask
+                self.write_and_log(cell, bit.bit_length(), available_mask ^ bit)
+                return False
+            # Else, we put it back to "None" and go back one more move
             cell.data = None
-            self.empty_cells.insert(0, cell)  # Insert it back in the "empty_cells" list
-            self.undo()
-        # Else, we try one of the other values
-        else:
-            value = available_values.pop()
-            self.write_and_log(cell, value, available_values)
+            self.empty_cells.append(cell)  # Put it back in the "empty_cells" list
 
-    def write_and_log(self, cell, data, other_available_values):
+    def write_and_log(self, cell, data, other_available_mask):
         """
         Description:
             Writes down a number in a Cell, and log the action in the history logs
@@ -323,17 +441,17 @@ class Sudoku:
         Args:
             cell (Cell): The Cell instance we want to write in
             data (int): The number from 1 to 9 to put in the cell
-            other_available_values (set): All the other possible/valid values for this cell
+            other_available_mask (int): 9-bit mask of all the other possible/valid values for this cell
         """
         # Increments the moves
         self.moves += 1
         self.total_moves += 1
         # Changes the cell value
         cell.data = data
-        # Logs the actions in both histories
-        action = self.ACTIONS[0]
-        self.history.append((action, cell, data, other_available_values))
-        self.complete_history.append((action, cell, data, other_available_values))
+        # Logs the action in the history, and in the complete history if enabled
+        self.history.append((ACTION_WRITE, cell, data, other_available_mask))
+        if self.record_complete_history:
+            self.complete_history.append((ACTION_WRITE, cell, data, other_available_mask))
 
     ################
     #  Properties  #
@@ -374,6 +492,21 @@ class Sudoku:
         grid = [array[i:i+9] for i in range(0, 81, 9)]
         return cls(grid)
 
+    @classmethod
+    def create_from_bytes(cls, data):
+        """
+        Description:
+            Creates a Sudoku instance from 81 bytes, where 0 represents an empty cell
+            Accepts any bytes-like object, such as "bytes", "bytearray", or "array.array('b')"
+        Args:
+            data (bytes): Bytes-like object containing 81 numbers
+        Raises:
+            IndexError: Whenever "data" does not contain exactly 81 elements
+        Returns:
+            Sudoku: The Sudoku instance created from the bytes
+        """
+        return cls.create_from_81(list(data))
+
     @classmethod
     def create_from_json(cls, filepath):
         """
@@ -392,62 +525,92 @@ class Sudoku:
         return cls(unsolved_grid)
 
     @classmethod
-    def generate_grid(cls, level, path=None, to_json=False):
+    def generate_grid(cls, level, path=None, to_json=False, workers=1):
         """
         Description:
             Loops until a valid sudoku is generated, based on the difficulty settings
-            The logic is as follows:
-            - We randomly populate the 0th, 4th and 8th squares of the sudoku (as they are independant)
-            - We then solve the sudoku using the Sudoku class
-            - We get the updated/full grid and randomly remove N numbers (based on difficulty)
-            - We try solving it again, and time the process
-            - If the solving is either too short or too long, we start from the beginning
-            Once the timing is OK, we will save the starting grid and output it as JSON
+            Each iteration is a call to "cls.try_generate_grid()", which tries several puzzles on a new full grid
+            The iterations are independent, so they can be spread over several processes using "workers"
+            Once the number of moves is OK, we will save the starting grid and output it as JSON
         Args:
             level (int): The difficulty of the sudoku
             path (str, optional): Output path for the JSON file. Only useful is to_json==True. Default to None.
             to_json (bool, optional): Indicates if the grid should be output in a JSON file instead of returned. Default to False.
+            workers (int, optional): Number of processes trying to generate a grid at the same time. Defaults to 1.
         Raises:
             KeyError: 'level' argument must be in Sudoku.DIFFICULTIES.keys()
         """
         # Checking the "level" input
         if level not in {1, 2, 3, 4, 5}:
             raise KeyError("'level' argument must be in Sudoku.DIFFICULTIES.keys()")
-        while True:
-            # Generating numbers for the squares 1, 5 and 9
-            seed()
-            grid = [[0 for i in range(9)] for j in range(9)]
-            for i in range(0, 9, 3):
-                numbers = list(Cell.NUMBERS)
-                for x in range(i, i + 3):
-                    for y in range(i, i + 3):
-                        number = choice(numbers)
-                        numbers.remove(number)
-                        grid[x][y] = number
-            # Solving the grid in random order, to have a new
-            sudoku = cls(grid)
-            sudoku.solve(randomly=True)
-            solved_grid = sudoku.solved_grid.copy()
-            # Randomly removing numbers from the grid
-            new_grid = solved_grid.copy()
-            level_info = cls.DIFFICULTIES[level]
-            coordinates = [(x, y) for x in range(9) for y in range(9)]
-            for i in range(level_info["empty_cells"]):
-                pos = choice(coordinates)
-                coordinates.remove(pos)
-                x, y = pos
+        result = None
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = {executor.submit(cls.try_generate_grid, level) for _ in range(workers)}
+                while result is None:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = result or future.result()
+                    # Keeping every worker busy until one of them finds a grid
+                    if result is None:
+                        pending |= {executor.submit(cls.try_generate_grid, level) for _ in done}
+                # Iterations are short, so the running ones are simply left to finish
+                for future in pending:
+                    future.cancel()
+        else:
+            while result is None:
+                result = cls.try_generate_grid(level)
+        new_grid, solved_grid = result
+        if to_json:
+            data = {"unsolved": new_grid, "solved": solved_grid}
+            cls.output_as_json(data, path)
+        else:
+            return new_grid
+
+    @classmethod
+    def try_generate_grid(cls, level):
+        """
+        Description:
+            Tries to generate a valid sudoku from a new full grid, based on the difficulty settings
+            The logic is as follows:
+            - We randomly populate the 0th, 4th and 8th squares of the sudoku (as they are independant)
+            - We then solve the sudoku using the Sudoku class
+            - We get the updated/full grid and randomly remove N numbers (based on difficulty)
+            - We try solving it again, and count the moves it takes
+            - If the solving takes either too few or too many moves, we remove a different set of numbers
+            - After "ATTEMPTS_PER_GRID" failures on the same full grid, we give up
+        Args:
+            level (int): The difficulty of the sudoku. Must be in Sudoku.DIFFICULTIES.keys()
+        Returns:
+            tuple: The unsolved and the solved 9x9 grids, or None if no valid sudoku was found
+        """
+        # Generating numbers for the squares 1, 5 and 9
+        grid = [[0 for i in range(9)] for j in range(9)]
+        for i in range(0, 9, 3):
+            numbers = list(Cell.NUMBERS)
+            shuffle(numbers)
+            for x in range(i, i + 3):
+                for y in range(i, i + 3):
+                    grid[x][y] = numbers.pop()
+        # Solving the grid in random order, to have a new
+        sudoku = cls(grid)
+        sudoku.solve(randomly=True)
+        solved_grid = sudoku.solved_grid
+        level_info = cls.DIFFICULTIES[level]
+        # A full grid can hold many puzzles, so we try several sets of empty cells before giving up
+        for _ in range(cls.ATTEMPTS_PER_GRID):
+            # Randomly removing numbers from a copy of the solved grid (rows are copied, so nothing is shared)
+            new_grid = [row[:] for row in solved_grid]
+            for pos in sample(range(81), level_info["empty_cells"]):
+                x, y = divmod(pos, 9)
                 new_grid[x][y] = None
             # Trying to solve it again
-            sudoku = Sudoku(new_grid)
-            sudoku.solve(time_limit=level_info["max_time"])
-            # If solved in time, then we output it as JSON, else we restart the process
-            if sudoku.solved and sudoku.time >= level_info["min_time"]:
-                if to_json:
-                    data = {"unsolved": new_grid, "solved": sudoku.solved_grid.copy()}
-                    cls.output_as_json(data, path)
-                    return
-                else:
-                    return new_grid
+            sudoku = cls(new_grid)
+            sudoku.solve(move_limit=level_info["max_moves"])
+            # If solved within the move window, then we return it, else we try again
+            if sudoku.solved and sudoku.total_moves >= level_info["min_moves"]:
+                return new_grid, sudoku.solved_grid
+        return None
 
     ####################
     #  Static Methods  #